@@ -0,0 +1,19 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+""" _vectors_c: C kernels for the hot float64 vector operations
+
+Build in place with:
+    python setup.py build_ext --inplace
+"""
+
+
+def dot(const double[::1] a, const double[::1] b):
+    """ dot: dot product of two float64 arrays of equal length """
+    cdef Py_ssize_t i, n = a.shape[0]
+    cdef double s = 0.0
+    if b.shape[0] != n:
+        raise ValueError('Vectors must have the same dimension')
+    with nogil:
+        for i in range(n):
+            s += a[i] * b[i]
+    return s
+
@@ -0,0 +1,28 @@
+""" Builds the optional C kernels used by vectors.py
+
+This script only compiles the _vectors_c extension in place, next to
+vectors.py. It does not package or install the project:
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+import sys
+
+from setuptools import setup, Extension
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    sys.exit('Building the C kernels requires Cython: pip install cython')
+
+setup(
+    name='laru-kernels',
+    ext_modules=cythonize(
+        Extension(
+            '_vectors_c',
+            ['_vectors_c.pyx'],
+            extra_compile_args=['-O3', '-march=native', '-ffast-math'],
+        ),
+        language_level=3,
+    ),
+)
@@ -1,54 +1,272 @@
 import numbers
 import math
-import decimal
-from decimal import Decimal, getcontext
+import operator
+from decimal import Decimal
+
+import numpy as np
+
+try:
+    # optional C kernels, built with: python setup.py build_ext --inplace
+    from . import _vectors_c
+except ImportError:
+    try:
+        # vectors.py used as a top level module
+        import _vectors_c
+    except ImportError:
+        _vectors_c = None
+
+_FLOAT64 = np.dtype(np.float64)
+
+
+# unrolled dot products over python floats for the common small
+# dimensions, where numpy's per call overhead outweighs the arithmetic
+def _dot1(a, b):
+    return a[0]*b[0]
+
+
+def _dot2(a, b):
+    return a[0]*b[0] + a[1]*b[1]
+
+
+def _dot3(a, b):
+    return a[0]*b[0] + a[1]*b[1] + a[2]*b[2]
+
+
+def _dot4(a, b):
+    return a[0]*b[0] + a[1]*b[1] + a[2]*b[2] + a[3]*b[3]
+
+
+def _dot_seq(a, b):
+    """ _dot_seq: dot product of two float sequences in pure python,
+    cheaper than a numpy call up to about 8 dimensions """
+    return math.fsum(map(operator.mul, a, b))
+
+
+_SMALL_DOT = {1: _dot1, 2: _dot2, 3: _dot3, 4: _dot4}
+
+# largest dimension for which dot stays in pure python
+_SMALL_DIM = 8
+
+
+def _dot(a, b):
+    """ _dot: dot product of two coordinate arrays """
+    if _vectors_c is not None and a.dtype is _FLOAT64 and b.dtype is _FLOAT64:
+        return _vectors_c.dot(a, b)
+    return float(np.dot(a, b))
+
+
+def _decompose(a, bn):
+    """ _decompose: splits a into components parallel and orthogonal
+    to the unit array bn """
+    par = np.dot(a, bn) * bn
+    return par, a - par
+
+
+def _vec_check(v, message='Argument must be a vector'):
+    """ _vec_check: raises TypeError unless v is a Vector. The class
+    identity test short circuits the common case before isinstance """
+    if v.__class__ is not Vector and not isinstance(v, Vector):
+        raise TypeError(message)
+
+
+def _dtype_check(dtype):
+    """ _dtype_check: returns dtype as a numpy dtype, raising TypeError
+    unless it is a floating point type """
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise TypeError('The dtype must be a floating point type')
+    return dtype
+
+
+def _dim_check(u, v):
+    """ _dim_check: raises ValueError unless u and v have the same
+    dimension, instead of letting numpy broadcast them """
+    if u.dimension != v.dimension:
+        raise ValueError('Vectors must have the same dimension')
 
-# set precision of decimal numbers
-getcontext().prec = 30
 
 class Vector(object):
     """Vector: A Simple Vector Object
 
     Attributes:
+        coordinates (numpy.ndarray): coordinates of the vector
+        dimension (int): number of coordinates
+
+    Coordinates default to float64. Passing dtype=np.float32 halves the
+    memory per coordinate and doubles the number of SIMD lanes NumPy can
+    use (8 per AVX2 register instead of 4), at the cost of precision.
+    Arithmetic between vectors keeps their dtype.
 
     """
-    def __init__(self, coordinates):
+    # no per instance __dict__; the underscored slots cache mag, norm
+    # and the float tuple used by the small dimension paths, None until
+    # first use
+    __slots__ = ('coordinates', 'dimension', '_mag', '_norm', '_floats')
+
+    def __init__(self, coordinates, dtype=np.float64):
         """__init__ method
 
         Args:
             coordinates (iterator): coordinates of the vector
+            dtype: numpy floating dtype used to store the coordinates,
+                float64 by default
 
         Raises:
-            decimal.InvalidOperation: If coordinates values are invalid
-            TypeError: if coordinates is not an iterator
+            ValueError: If coordinates are empty, not one dimensional
+                or values are not finite numbers
+            TypeError: if coordinates is not an iterator or dtype is not
+                a floating point type
         """
 
-        if not coordinates:
-            raise ValueError
-
+        dtype = _dtype_check(dtype)
         try:
-            self.coordinates = tuple([Decimal(x) for x in coordinates])
-        except decimal.InvalidOperation:
-            raise decimal.InvalidOperation('The coordinates must be a valid number')
+            # always copy, so the caller cannot mutate the vector
+            coordinates = np.array(coordinates, dtype=dtype)
+        except ValueError:
+            raise ValueError('The coordinates must be a valid number')
         except TypeError:
             raise TypeError('The coordinates must be iterable')
 
+        if coordinates.ndim == 0:
+            raise TypeError('The coordinates must be iterable')
+        if coordinates.ndim != 1:
+            raise ValueError('The coordinates must be one dimensional')
+        if not coordinates.size:
+            raise ValueError('The coordinates must not be empty')
+        if not np.isfinite(coordinates).all():
+            raise ValueError('The coordinates must be a valid number')
+
+        # read only, so the cached mag, norm and floats never go stale
+        coordinates.setflags(write=False)
+        self.coordinates = coordinates
+
         # dimension of vector
-        self.dimension = len(coordinates)
+        self.dimension = self.coordinates.size
+
+        # lazily filled caches
+        self._mag = self._norm = self._floats = None
+
+    @property
+    def dtype(self):
+        """ numpy.dtype: dtype of the coordinates """
+        return self.coordinates.dtype
+
+    @classmethod
+    def _unchecked(cls, arr):
+        """ _unchecked: wraps an already valid coordinate array without
+        re-running the validation done in __init__. Used wherever the
+        class itself produces a vector from its own arithmetic.
+
+        Args:
+            arr: contiguous one dimensional numpy array
+
+        Returns:
+            Vector
+
+        """
+        self = cls.__new__(cls)
+        arr.setflags(write=False)
+        self.coordinates = arr
+        self.dimension = arr.size
+        self._mag = self._norm = self._floats = None
+        return self
+
+    @staticmethod
+    def from_array_batch(A, dtype=np.float64):
+        """ from_array_batch: wraps each row of a 2D array as a Vector.
+        A is copied once into a read only array and the vectors are
+        views of its rows, so later changes to A do not affect them.
+
+        Args:
+            A: array like of shape (N, dimension)
+            dtype: numpy floating dtype of the vectors
+
+        Returns:
+            list of N Vector objects
+
+        Raises:
+            ValueError: if A is not two dimensional, has no columns or
+                values are not finite numbers
+            TypeError: if dtype is not a floating point type
+
+        """
+        A = np.array(A, dtype=_dtype_check(dtype), order='C')
+        if A.ndim != 2:
+            raise ValueError('Batch must be a 2D array of shape (N, dimension)')
+        if not A.shape[1]:
+            raise ValueError('The coordinates must not be empty')
+        if not np.isfinite(A).all():
+            raise ValueError('The coordinates must be a valid number')
+        A.setflags(write=False)
+        return [Vector._unchecked(row) for row in A]
+
+    @staticmethod
+    def dot_many(A, B):
+        """ dot_many: row wise dot products of two batches of vectors.
+        Prefer this over calling dot in a loop; build the (N, dimension)
+        arrays directly rather than going through Vector objects.
+
+        Args:
+            A: array like of shape (N, dimension)
+            B: array like of shape (N, dimension)
+
+        Returns:
+            numpy array of N dot products
+
+        """
+        return np.einsum('ij,ij->i', A, B)
+
+    @staticmethod
+    def cross_many(A, B):
+        """ cross_many: row wise cross products of two batches of
+        3 dimensional vectors
+
+        Args:
+            A: array like of shape (N, 3)
+            B: array like of shape (N, 3)
+
+        Returns:
+            numpy array of shape (N, 3)
+
+        """
+        return np.cross(A, B, axis=1)
+
+    @property
+    def _tup(self):
+        """ tuple: coordinates as python floats for the small dimension
+        paths, computed once and cached """
+        if self._floats is None:
+            self._floats = tuple(self.coordinates.tolist())
+        return self._floats
+
 
     @property
     def mag(self):
-        """ Decimal: Magnitude of a vector """
-        return Decimal(math.sqrt(sum([x**2 for x in self.coordinates])))
+        """ float: Magnitude of a vector, computed once and cached """
+        if self._mag is None:
+            if self.dimension <= _SMALL_DIM:
+                self._mag = math.hypot(*self._tup)
+            else:
+                # scale by the largest coordinate first, like math.hypot,
+                # so squaring cannot overflow or underflow
+                m = float(np.max(np.abs(self.coordinates)))
+                if m == 0:
+                    self._mag = 0.0
+                else:
+                    scaled = self.coordinates / m
+                    self._mag = m * math.sqrt(np.dot(scaled, scaled))
+        return self._mag
 
 
     @property
     def norm(self):
-        """ Vector: Normalization of a vector """
-        if (self.mag != 0):
-            return self.__mul__((Decimal(1.0)/self.mag))
-        else:
-            raise ZeroDivisionError('Cannot normalize the zero vector')
+        """ Vector: Normalization of a vector, computed once and cached """
+        if self._norm is None:
+            m = self.mag
+            if m == 0:
+                raise ZeroDivisionError('Cannot normalize the zero vector')
+            self._norm = Vector._unchecked(self.coordinates / m)
+        return self._norm
 
 
     def dot(self, v):
@@ -58,15 +276,19 @@ class Vector(object):
             v: Vector object
 
         Returns:
-            Decimal
+            float
 
         Raises:
             TypeError: if v is not a vector
+            ValueError: if v has a different dimension
 
         """
-        if not isinstance(v, Vector):
-            raise TypeError('Argument must be a vector')
-        return Decimal(sum([x * v.coordinates[i] for i, x in enumerate(self.coordinates)]))
+        _vec_check(v)
+        _dim_check(self, v)
+        if self.dimension <= _SMALL_DIM:
+            small_dot = _SMALL_DOT.get(self.dimension, _dot_seq)
+            return small_dot(self._tup, v._tup)
+        return _dot(self.coordinates, v.coordinates)
 
 
     def cross(self, v):
@@ -83,21 +305,18 @@ class Vector(object):
             NotImplementedError: If dimension not equal to 3
 
         """
-        if not isinstance(v, Vector):
-            raise TypeError('Argument must be a vector')
+        _vec_check(v)
 
         if not (self.dimension == v.dimension == 3):
             raise NotImplementedError
 
-        x1, y1, z1 = self.coordinates
-        x2, y2, z2 = v.coordinates
-
-        # basic cross product formula for 3 dimensional vector
-        x = y1*z2 - y2*z1
-        y = -(x1*z2 - x2*z1)
-        z = x1*y2 - x2*y1
-
-        return Vector([x,y,z])
+        x1, y1, z1 = self._tup
+        x2, y2, z2 = v._tup
+        dtype = self.coordinates.dtype
+        if v.coordinates.dtype is not dtype:
+            dtype = np.result_type(dtype, v.coordinates.dtype)
+        return Vector._unchecked(np.array(
+            (y1*z2 - z1*y2, z1*x2 - x1*z2, x1*y2 - y1*x2), dtype=dtype))
 
 
     def area_of_parallelogram(self, v):
@@ -108,16 +327,22 @@ class Vector(object):
             v: Vector object
 
         Returns:
-            Decimal: area of parellelogram
+            float: area of parellelogram
 
         Raises:
             TypeError: if v is not a vector
+            NotImplementedError: If dimension not equal to 3
 
         """
-        if not isinstance(v, Vector):
-            raise TypeError('Argument must be a vector')
+        _vec_check(v)
 
-        return (self.cross(v)).mag
+        if not (self.dimension == v.dimension == 3):
+            raise NotImplementedError
+
+        # magnitude of the cross product without building the vector
+        x1, y1, z1 = self._tup
+        x2, y2, z2 = v._tup
+        return math.hypot(y1*z2 - z1*y2, z1*x2 - x1*z2, x1*y2 - y1*x2)
 
 
     def area_of_triangle(self, v):
@@ -127,14 +352,14 @@ class Vector(object):
             v: Vector object
 
         Returns:
-            Decimal: area of triangle
+            float: area of triangle
 
         Raises:
             TypeError: if v is not a vector
+            NotImplementedError: If dimension not equal to 3
 
         """
-        if not isinstance(v, Vector):
-            raise TypeError('Argument must be a vector')
+        _vec_check(v)
 
         return self.area_of_parallelogram(v) / 2
 
@@ -155,15 +380,15 @@ class Vector(object):
             Exception: if product of magnitude of two vectors is zero
 
         """
-        if not isinstance(v, Vector):
-            raise TypeError('Argument must be a vector')
+        _vec_check(v)
 
         mag_product = self.mag * v.mag
         if mag_product == 0:
             raise Exception('Cannot find angle for a zero vector')
 
-        a = self.__clean_angle(self.dot(v)/mag_product)
-        t = math.acos(a)
+        # clamp the cosine into [-1, 1] against rounding error
+        cos_t = self.dot(v) / mag_product
+        t = math.acos(-1.0 if cos_t < -1.0 else (1.0 if cos_t > 1.0 else cos_t))
         if in_degrees:
             return math.degrees(t)
         return t
@@ -182,10 +407,10 @@ class Vector(object):
             TypeError: if v is not a vector
 
         """
-        if not isinstance(v, Vector):
-            raise TypeError('Argument must be a vector')
+        _vec_check(v)
 
-        return self.dot(v.norm) * v.norm
+        vn = v.norm
+        return self.dot(vn) * vn
 
 
     def orthogonal_to(self, v):
@@ -201,10 +426,10 @@ class Vector(object):
             TypeError: if v is not a vector
 
         """
-        if not isinstance(v, Vector):
-            raise TypeError('Argument must be a vector')
+        _vec_check(v)
 
-        return self.__sub__(self.proj_on(v))
+        par, orth = self.decompose(v)
+        return orth
 
 
     def decompose(self, v):
@@ -221,10 +446,11 @@ class Vector(object):
             TypeError: if v is not a vector
 
         """
-        if not isinstance(v, Vector):
-            raise TypeError('Argument must be a vector')
+        _vec_check(v)
 
-        return (self.proj_on(v), self.orthogonal_to(v))
+        # one norm and one dot shared by both components
+        par, orth = _decompose(self.coordinates, v.norm.coordinates)
+        return (Vector._unchecked(par), Vector._unchecked(orth))
 
 
     def is_zero(self, tolerance=1e-10):
@@ -256,17 +482,18 @@ class Vector(object):
             TypeError: If v is not a vector
 
         """
-        if not isinstance(v, Vector):
-            raise TypeError('Argument must be a vector')
+        _vec_check(v)
 
         return abs(self.dot(v)) < tolerance
 
 
-    def is_parallel_to(self, v):
-        """ is_parallel_to: check if two vectors are parallel
+    def is_parallel_to(self, v, tolerance=1e-10):
+        """ is_parallel_to: check if two vectors are parallel, i.e. the
+        part of self orthogonal to v vanishes relative to |self|
 
         Args:
             v: Vector object
+            tolerance: tolerance for sin(theta) to be zero
 
         Returns:
             True: if two vectors are parallel to each other
@@ -276,34 +503,40 @@ class Vector(object):
             TypeError: If v is not a vector
 
         """
-        if not isinstance(v, Vector):
-            raise TypeError('Argument must be a vector')
+        _vec_check(v)
 
-        return (self.is_zero() or
-                v.is_zero() or
-                self.theta(v) == Decimal(math.pi) or
-                self.theta(v) == Decimal(0))
+        if self.is_zero() or v.is_zero():
+            return True
+        # |orth| / |self| is sin(theta), without the cancellation that
+        # 1 - cos(theta) suffers for small angles
+        par, orth = _decompose(self.coordinates, v.norm.coordinates)
+        return math.sqrt(np.dot(orth, orth)) < tolerance * self.mag
 
 
-    def __clean_angle(self, a):
-        """ __clean_angle: constraint angle between [-1, 1]
+    def __add__(self, v):
+        """ __add__: Sum of two Vectors
 
         Args:
-            a: angle to be constrained
+            v: Vector object
 
         Returns:
-            Decimal: constrained number between -1 and 1
+            Vector object
 
         Raises:
-            TypeError: if a is not a number
+            TypeError: if v is not a Vector
+            ValueError: if v has a different dimension
 
         """
-        if not isinstance(a, numbers.Number):
-            raise TypeError('Invalied number provided')
-        return Decimal(min(1, max(a, -1)))
+        _vec_check(v, 'You can only add two vectors')
+        _dim_check(self, v)
+        return Vector._unchecked(self.coordinates + v.coordinates)
 
-    def __add__(self, v):
-        """ __add__: Sum of two Vectors
+    # allow in reverse
+    __radd__ = __add__
+
+
+    def __sub__(self, v):
+        """ __sub__: Subtration of two Vectors
 
         Args:
             v: Vector object
@@ -313,18 +546,16 @@ class Vector(object):
 
         Raises:
             TypeError: if v is not a Vector
+            ValueError: if v has a different dimension
 
         """
-        if not isinstance(v, Vector):
-            raise TypeError('You can only add two vectors')
-        return Vector([x + v.coordinates[i] for i, x in enumerate(self.coordinates)])
+        _vec_check(v, 'You can only subtract two vectors')
+        _dim_check(self, v)
+        return Vector._unchecked(self.coordinates - v.coordinates)
 
-    # allow in reverse
-    __radd__ = __add__
 
-
-    def __sub__(self, v):
-        """ __sub__: Subtration of two Vectors
+    def __rsub__(self, v):
+        """ __rsub__: Subtraction of self from v, i.e. v - self
 
         Args:
             v: Vector object
@@ -334,14 +565,12 @@ class Vector(object):
 
         Raises:
             TypeError: if v is not a Vector
+            ValueError: if v has a different dimension
 
         """
-        if not isinstance(v, Vector):
-            raise TypeError('You can only add two vectors')
-        return Vector([x - v.coordinates[i] for i, x in enumerate(self.coordinates)])
-
-    # allow in reverse
-    __rsub__ = __sub__
+        _vec_check(v, 'You can only subtract two vectors')
+        _dim_check(self, v)
+        return Vector._unchecked(v.coordinates - self.coordinates)
 
 
     def __mul__(self, v):
@@ -355,11 +584,12 @@ class Vector(object):
             Vector
 
         Raises:
-            TypeError: if v is not a vector or a number
+            TypeError: if v is not a vector or a real number
 
         """
-        if (isinstance(v, numbers.Number)):
-            return Vector([x * v for x in self.coordinates])
+        # Decimal is not registered as a numbers.Real
+        if (isinstance(v, (numbers.Real, Decimal))):
+            return Vector._unchecked(self.coordinates * float(v))
         elif (isinstance(v, Vector)):
             return self.cross(v)
         raise TypeError('Argument must be number or a vector')
@@ -378,4 +608,4 @@ class Vector(object):
 
     def __eq__(self, v):
         """ checks the equality of two vectors """
-        return self.coordinates == v.coordinates
+        return np.array_equal(self.coordinates, v.coordinates)